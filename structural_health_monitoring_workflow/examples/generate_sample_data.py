@@ -17,6 +17,14 @@ import pandas as pd
 import yaml
 from pathlib import Path
 from datetime import datetime, timedelta
+from functools import lru_cache, partial
+from concurrent.futures import ProcessPoolExecutor
+
+# Prefer the libyaml C loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
 
 # Add utils to path for config loading
 sys.path.append(str(Path(__file__).parent.parent / 'src' / 'utils'))
@@ -26,12 +34,231 @@ try:
 except ImportError:
     def load_config(config_path):
         with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=SafeLoader)
+
+
+try:
+    from numba import njit, prange, set_num_threads
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import numexpr as ne
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+
+# Working-set budget (bytes) for one block of samples in _build_signals_numpy; sized to fit in L2
+TILE_BYTES = 512 * 1024
+
+
+@lru_cache(maxsize=4)
+def _time_vector(fs, n_samples):
+    """Read-only sample times (exact multiples of the sample period), memoized."""
+    t = np.arange(n_samples) / fs
+    t.flags.writeable = False
+    return t
+
+
+def _sincos_basis(t, freqs):
+    """
+    Evaluate the sine/cosine basis shared by all sensors.
+    
+    Together with the angle-addition identity
+    sin(w*t + phase) = sin(w*t)*cos(phase) + cos(w*t)*sin(phase),
+    this basis turns every sensor's modal response into a linear combination
+    of 2*M rows, so only M sines and M cosines are evaluated over the time axis.
+    
+    Parameters:
+    - t: time vector, shape (N,)
+    - freqs: modal frequencies in Hz, shape (M,)
+    
+    Returns:
+    - float32 array of shape (2*M, N): rows [sin(2*pi*f_m*t)..., cos(2*pi*f_m*t)...]
+    """
+    n_modes = len(freqs)
+    basis = np.empty((2 * n_modes, len(t)), dtype=np.float32)
+    omega = (2 * np.pi * np.asarray(freqs))[:, None]
+    if NUMEXPR_AVAILABLE:
+        local_dict = {'omega': omega, 't': t}
+        ne.evaluate('sin(omega * t)', local_dict=local_dict, out=basis[:n_modes], casting='same_kind')
+        ne.evaluate('cos(omega * t)', local_dict=local_dict, out=basis[n_modes:], casting='same_kind')
+    else:
+        args = np.empty(len(t))
+        for m in range(n_modes):
+            np.multiply(t, omega[m], out=args)
+            np.sin(args, out=basis[m])
+            np.cos(args, out=basis[n_modes + m])
+    return basis
+
+
+def _build_signals_numpy(coefs, basis, noise_level, t, trend_coarse, out, sums):
+    """
+    Turn unit noise in out into full sensor signals, in place (NumPy version).
+    
+    out = noise_level * out + coefs @ basis + trend, evaluated one block of
+    samples at a time so every term is added while the block is still
+    cache-resident. The per-sensor sums needed for re-centering are
+    accumulated in the same pass.
+    
+    Parameters:
+    - coefs: float32 basis coefficients, shape (S, 2*M)
+    - basis: float32 output of _sincos_basis, shape (2*M, N)
+    - noise_level: amplitude of the noise
+    - t: time vector, shape (N,)
+    - trend_coarse: trend sampled every second from t=0, shape (S, T)
+    - out: float32 array of shape (S, N), pre-filled with unit-variance noise
+    - sums: float64 array of shape (S,), receives the sum of each output row
+    """
+    n_sensors, n_basis = coefs.shape
+    n_samples = basis.shape[1]
+    t_coarse = np.arange(trend_coarse.shape[1], dtype=np.float64)
+    tile = max(1, TILE_BYTES // (4 * (n_basis + 2 * n_sensors)))
+    product_buf = np.empty((n_sensors, min(tile, n_samples)), dtype=np.float32)
+    sums[:] = 0.0
+    for k in range(0, n_samples, tile):
+        chunk = slice(k, min(k + tile, n_samples))
+        block = out[:, chunk]
+        product = product_buf[:, :chunk.stop - k]
+        block *= noise_level
+        np.matmul(coefs, basis[:, chunk], out=product)
+        block += product
+        for s in range(n_sensors):
+            block[s] += np.interp(t[chunk], t_coarse, trend_coarse[s])
+        sums += block.sum(axis=1, dtype=np.float64)
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _build_signals(coefs, basis, noise_level, t, trend_coarse, out, sums):
+        """Numba version of _build_signals_numpy: one fused pass, parallel over sensors."""
+        n_sensors, n_basis = coefs.shape
+        for s in prange(n_sensors):
+            total = 0.0
+            for n in range(basis.shape[1]):
+                acc = noise_level * out[s, n]
+                for k in range(n_basis):
+                    acc += coefs[s, k] * basis[k, n]
+                # Linear interpolation on the 1 s trend grid
+                idx = int(t[n])
+                frac = t[n] - idx
+                acc += trend_coarse[s, idx] + frac * (trend_coarse[s, idx + 1] - trend_coarse[s, idx])
+                out[s, n] = acc
+                total += out[s, n]
+            sums[s] = total
+else:
+    _build_signals = _build_signals_numpy
+
+
+def _artifact_offset(signal_mean, n_samples, outlier_start, outlier_end, shift,
+                     start_gain, end_gain, edge_samples, target_mean):
+    """
+    Offset that brings a signal to target_mean once the artifacts are added.
+    
+    The mean of the outlier shift and the edge ramps is known analytically, so
+    the signal does not have to be re-read after they are applied.
+    """
+    step = 1.0 / max(edge_samples - 1, 1)
+    ramp_sum = step * edge_samples * (edge_samples - 1) / 2  # sum of n * step over the ramp
+    artifact_sum = (shift * (outlier_end - outlier_start)
+                    + start_gain * (2.0 * edge_samples - 2.0 * ramp_sum)
+                    + end_gain * (-1.5 * ramp_sum))
+    return target_mean - (signal_mean + artifact_sum / n_samples)
+
+
+def _apply_artifacts_numpy(signal, signal_mean, outlier_start, outlier_end, shift,
+                           start_gain, end_gain, edge_samples, target_mean):
+    """
+    Add outlier and edge artifacts to one sensor signal and re-center it, in place.
+    
+    Parameters:
+    - signal: float32 sensor signal, shape (N,)
+    - signal_mean: mean of signal before the artifacts are added
+    - outlier_start, outlier_end: sample range of the systematic shift
+    - shift: shift amplitude (0 for no outlier)
+    - start_gain, end_gain: gains of the 2 -> 0 start ramp and the 0 -> -1.5
+      end ramp over edge_samples samples (0 for no edge artifact)
+    - edge_samples: length of each edge ramp
+    - target_mean: mean of the returned signal
+    """
+    n_samples = len(signal)
+    signal += _artifact_offset(signal_mean, n_samples, outlier_start, outlier_end, shift,
+                               start_gain, end_gain, edge_samples, target_mean)
+    
+    if shift != 0.0:
+        signal[outlier_start:outlier_end] += shift
+    
+    ramp_steps = np.arange(edge_samples, dtype=np.float32) / max(edge_samples - 1, 1)
+    if start_gain != 0.0:
+        signal[:edge_samples] += (2.0 - 2.0 * ramp_steps) * start_gain
+    if end_gain != 0.0:
+        signal[n_samples - edge_samples:] += (-1.5 * ramp_steps) * end_gain
+
+
+if NUMBA_AVAILABLE:
+    _artifact_offset_jit = njit(cache=True)(_artifact_offset)
+    
+    @njit(cache=True)
+    def _apply_artifacts(signal, signal_mean, outlier_start, outlier_end, shift,
+                         start_gain, end_gain, edge_samples, target_mean):
+        """Numba version of _apply_artifacts_numpy: a single write pass over signal."""
+        n_samples = signal.shape[0]
+        offset = _artifact_offset_jit(signal_mean, n_samples, outlier_start, outlier_end, shift,
+                                      start_gain, end_gain, edge_samples, target_mean)
+        step = 1.0 / max(edge_samples - 1, 1)
+        end_edge_start = n_samples - edge_samples
+        for n in range(n_samples):
+            value = offset
+            if outlier_start <= n < outlier_end:
+                value += shift
+            if n < edge_samples:
+                value += (2.0 - 2.0 * n * step) * start_gain
+            if n >= end_edge_start:
+                value += -1.5 * (n - end_edge_start) * step * end_gain
+            signal[n] += value
+else:
+    _apply_artifacts = _apply_artifacts_numpy
+
+
+def make_time_index(start_time, fs, n_samples):
+    """
+    Build a uniformly sampled DatetimeIndex in a single vectorized add.
+    
+    Parameters:
+    - start_time: timestamp of the first sample (datetime, Timestamp or ISO string)
+    - fs: sampling frequency in Hz
+    - n_samples: number of samples
+    
+    Returns:
+    - pandas DatetimeIndex
+    """
+    sample_period = np.timedelta64(int(round(1e9 / fs)), 'ns')
+    return pd.DatetimeIndex(pd.Timestamp(start_time).to_datetime64()
+                            + np.arange(n_samples, dtype='int64') * sample_period)
+
+
+def reconstruct_index(acceleration_data, metadata):
+    """
+    Restore the DatetimeIndex of data saved without one (include_time_index=False).
+    
+    Parameters:
+    - acceleration_data: pandas DataFrame with a default RangeIndex
+    - metadata: metadata dictionary with 'start_time' and 'sampling_frequency'
+    
+    Returns:
+    - the same DataFrame, indexed by sample timestamps
+    """
+    acceleration_data.index = make_time_index(metadata['start_time'],
+                                              metadata['sampling_frequency'],
+                                              len(acceleration_data))
+    return acceleration_data
 
 
 def generate_synthetic_acceleration_data(sensor_names, duration_minutes=25, fs=250, 
                                        base_frequencies=[5, 12, 18, 25, 35], 
-                                       noise_level=0.05, trend_amplitude=0.02):
+                                       noise_level=0.05, trend_amplitude=0.02, start_time=None,
+                                       rng=None, include_time_index=True):
     """
     Generate synthetic acceleration data with modal characteristics.
     
@@ -42,6 +269,10 @@ def generate_synthetic_acceleration_data(sensor_names, duration_minutes=25, fs=2
     - base_frequencies: fundamental frequencies to simulate
     - noise_level: amplitude of random noise
     - trend_amplitude: amplitude of low-frequency trends
+    - start_time: timestamp of the first sample (default: current minute)
+    - rng: numpy random Generator used for all random draws (default: fresh generator)
+    - include_time_index: index the DataFrame by timestamps; if False a default
+      RangeIndex is used and reconstruct_index() can restore the timestamps
     
     Returns:
     - pandas DataFrame with synthetic acceleration data
@@ -49,77 +280,97 @@ def generate_synthetic_acceleration_data(sensor_names, duration_minutes=25, fs=2
     # Calculate number of samples
     n_samples = int(duration_minutes * 60 * fs)
     
-    # Create time vector
-    t = np.linspace(0, duration_minutes * 60, n_samples)
+    # Create time vector (exact multiples of the sample period, matching the index)
+    t = _time_vector(fs, n_samples)
     
     # Create datetime index
-    start_time = datetime.now().replace(second=0, microsecond=0)
-    time_index = pd.date_range(start=start_time, periods=n_samples, freq=f'{1000/fs}ms')
+    time_index = None
+    if include_time_index:
+        if start_time is None:
+            start_time = datetime.now().replace(second=0, microsecond=0)
+        time_index = make_time_index(start_time, fs, n_samples)
     
-    # Initialize data dictionary
-    data = {}
+    if rng is None:
+        rng = np.random.default_rng()
     
-    for i, sensor in enumerate(sensor_names):
-        # Start with base signal
-        signal = np.zeros(n_samples)
-        
-        # Add modal contributions
-        for j, freq in enumerate(base_frequencies):
-            # Mode shape factor (varies by sensor position)
-            mode_factor = np.sin(np.pi * (i + 1) / (len(sensor_names) + 1))
-            
-            # Add modal response with some frequency variation
-            freq_var = freq * (1 + 0.02 * np.random.randn())  # 2% frequency variation
-            amplitude = 0.1 * mode_factor * (1 / (j + 1))  # Decreasing amplitude with mode number
-            phase = np.random.uniform(0, 2*np.pi)  # Random phase
-            
-            signal += amplitude * np.sin(2 * np.pi * freq_var * t + phase)
-        
-        # Add low-frequency trend (simulate environmental effects)
-        trend_freq = 0.001 + 0.001 * np.random.randn()  # Very low frequency
-        trend = trend_amplitude * np.sin(2 * np.pi * trend_freq * t + np.random.uniform(0, 2*np.pi))
-        signal += trend
-        
-        # Add random noise
-        noise = noise_level * np.random.randn(n_samples)
-        signal += noise
-        
-        # Add some occasional "outliers" - sudden shifts
-        if np.random.rand() < 0.1:  # 10% chance of outlier region
-            outlier_start = np.random.randint(int(0.1 * n_samples), int(0.8 * n_samples))
-            outlier_duration = np.random.randint(int(0.01 * n_samples), int(0.05 * n_samples))
-            outlier_end = min(outlier_start + outlier_duration, n_samples)
-            
-            # Add systematic shift
-            shift_amplitude = 0.3 * np.random.randn()
-            signal[outlier_start:outlier_end] += shift_amplitude
-        
-        # Simulate sensor attachment/detachment artifacts at edges
-        if np.random.rand() < 0.2:  # 20% chance of edge artifact
-            edge_samples = int(0.02 * n_samples)  # 2% of signal at each edge
-            
-            # Start edge artifact
-            if np.random.rand() < 0.5:
-                ramp = np.linspace(2.0, 0, edge_samples)
-                signal[:edge_samples] += ramp * np.random.randn()
-            
-            # End edge artifact  
-            if np.random.rand() < 0.5:
-                ramp = np.linspace(0, -1.5, edge_samples)
-                signal[-edge_samples:] += ramp * np.random.randn()
+    n_sensors = len(sensor_names)
+    n_modes = len(base_frequencies)
+    edge_samples = int(0.02 * n_samples)  # 2% of signal at each edge
+    
+    # Draw all random parameters for the segment up front, one row per sensor.
+    # Modal frequencies are properties of the structure, shared by all sensors.
+    freq_jitter = rng.standard_normal(n_modes)
+    phases = rng.uniform(0, 2*np.pi, (n_sensors, n_modes))  # Random phase
+    trend_freqs = 0.001 + 0.001 * rng.standard_normal(n_sensors)  # Very low frequency
+    trend_phases = rng.uniform(0, 2*np.pi, n_sensors)
+    # Unit noise is drawn straight into the output buffer; the other terms are added on top
+    signals = np.empty((n_sensors, n_samples), dtype=np.float32)
+    rng.standard_normal(dtype=np.float32, out=signals)
+    has_outlier = rng.random(n_sensors) < 0.1  # 10% chance of outlier region
+    outlier_starts = rng.integers(int(0.1 * n_samples), int(0.8 * n_samples), n_sensors)
+    outlier_durations = rng.integers(int(0.01 * n_samples), int(0.05 * n_samples), n_sensors)
+    shift_amplitudes = 0.3 * rng.standard_normal(n_sensors)
+    has_edge_artifact = rng.random(n_sensors) < 0.2  # 20% chance of edge artifact
+    has_start_edge = rng.random(n_sensors) < 0.5
+    has_end_edge = rng.random(n_sensors) < 0.5
+    start_edge_gains = rng.standard_normal(n_sensors)
+    end_edge_gains = rng.standard_normal(n_sensors)
+    target_means = rng.uniform(-1.05, -0.95, n_sensors)  # Within typical QC bounds
+    
+    # Mode shape factors (vary by sensor position) and modal amplitudes, shape (S, M)
+    mode_factors = np.sin(np.pi * np.arange(1, n_sensors + 1) / (n_sensors + 1))
+    amps = 0.1 * mode_factors[:, None] / np.arange(1, n_modes + 1)[None, :]  # Decreasing amplitude with mode number
+    freqs = np.asarray(base_frequencies) * (1 + 0.02 * freq_jitter)  # 2% frequency variation
+    
+    # Angle addition: amp*sin(w*t + phase) = amp*cos(phase)*sin(w*t) + amp*sin(phase)*cos(w*t)
+    coefs = np.hstack([amps * np.cos(phases), amps * np.sin(phases)]).astype(np.float32)
+    
+    # Output signals are float32. Phase arguments are evaluated in float64 because
+    # 2*pi*f*t reaches ~1e5 rad over a segment, beyond float32 resolution.
+    basis = _sincos_basis(t, freqs)
+    
+    # Low-frequency trend (simulate environmental effects). It varies on a
+    # ~1000 s scale, so it is evaluated on a 1 s grid and linearly interpolated.
+    t_coarse = np.arange(0, duration_minutes * 60 + 1.0)
+    trend_coarse = trend_amplitude * np.sin((2 * np.pi * trend_freqs)[:, None] * t_coarse
+                                            + trend_phases[:, None])
+    
+    # Scale noise, add modal response and trend in one pass; row sums give the means
+    sums = np.empty(n_sensors)
+    _build_signals(coefs, basis, noise_level, t, trend_coarse, signals, sums)
+    signal_means = sums / n_samples
+    
+    for i in range(n_sensors):
+        # Occasional "outliers" - sudden systematic shifts
+        shift = shift_amplitudes[i] if has_outlier[i] else 0.0
+        outlier_start = outlier_starts[i]
+        outlier_end = min(outlier_start + outlier_durations[i], n_samples)
         
-        # Scale to typical acceleration range (adjust mean to be within QC bounds)
-        target_mean = np.random.uniform(-1.05, -0.95)  # Within typical QC bounds
-        signal = signal - np.mean(signal) + target_mean
+        # Sensor attachment/detachment artifacts at edges
+        start_gain = start_edge_gains[i] if has_edge_artifact[i] and has_start_edge[i] else 0.0
+        end_gain = end_edge_gains[i] if has_edge_artifact[i] and has_end_edge[i] else 0.0
         
-        data[sensor] = signal
+        # Add artifacts and scale to typical acceleration range (mean within QC bounds)
+        _apply_artifacts(signals[i], signal_means[i], outlier_start, outlier_end, shift,
+                         start_gain, end_gain, edge_samples, target_means[i])
     
-    # Create DataFrame
-    df = pd.DataFrame(data, index=time_index)
+    # Create DataFrame. signals.T is a view of the sensor-major (S, N) array, which
+    # matches pandas' column-block layout, so no per-column copies are made.
+    df = pd.DataFrame(signals.T, columns=sensor_names, index=time_index, copy=False)
     
     return df
 
 
+def _default_metadata():
+    """Minimal metadata for synthetic files written without explicit metadata."""
+    return {
+        'tag_columns': [],  # No tag columns in synthetic data
+        'sampling_frequency': 250,
+        'generation_timestamp': datetime.now().isoformat(),
+        'synthetic': True
+    }
+
+
 def create_sample_pickle_file(output_path, acceleration_data, metadata=None):
     """
     Create a pickle file in the expected format.
@@ -130,23 +381,116 @@ def create_sample_pickle_file(output_path, acceleration_data, metadata=None):
     - metadata: optional metadata dictionary
     """
     if metadata is None:
-        metadata = {
-            'tag_columns': [],  # No tag columns in synthetic data
-            'sampling_frequency': 250,
-            'generation_timestamp': datetime.now().isoformat(),
-            'synthetic': True
-        }
+        metadata = _default_metadata()
     
     data_dict = {
         'accelerations': acceleration_data,
         'metadata': metadata
     }
     
+    # Protocol 5 (Python 3.8+) writes the DataFrame's array buffers without extra copies
     with open(output_path, 'wb') as f:
-        pickle.dump(data_dict, f)
+        pickle.dump(data_dict, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def create_sample_parquet_file(output_path, acceleration_data, metadata=None):
+    """
+    Create a Parquet file (Snappy-compressed) with a sibling YAML metadata file.
+    
+    Requires pyarrow (or fastparquet). The metadata is written next to the data
+    file with the same name and a .yaml extension.
+    
+    Parameters:
+    - output_path: path for output .parquet file
+    - acceleration_data: pandas DataFrame with acceleration data
+    - metadata: optional metadata dictionary
+    """
+    if metadata is None:
+        metadata = _default_metadata()
+    
+    acceleration_data.to_parquet(output_path, compression='snappy')
+    
+    with open(Path(output_path).with_suffix('.yaml'), 'w') as f:
+        yaml.dump(metadata, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
+
 
+def _init_worker():
+    """Keep each worker process single-threaded; parallelism comes from the pool."""
+    if NUMBA_AVAILABLE:
+        set_num_threads(1)
+    if NUMEXPR_AVAILABLE:
+        ne.set_num_threads(1)
 
-def generate_sample_dataset(config, output_dir, n_segments=10, case_name='sample'):
+
+def _generate_one_segment(segment, seed_sequence, sensor_names, fs, output_path, case_name,
+                          output_format='pickle', include_time_index=True):
+    """
+    Generate and save a single segment of the sample dataset.
+    
+    Parameters:
+    - segment: segment number (1-based)
+    - seed_sequence: numpy SeedSequence for this segment's random generator
+    - sensor_names: list of sensor channel names
+    - fs: sampling frequency in Hz
+    - output_path: output directory for sample files
+    - case_name: name prefix for files
+    - output_format: 'pickle' or 'parquet'
+    - include_time_index: store the DatetimeIndex in the file
+    
+    Returns:
+    - name of the written file
+    """
+    # Generate time stamps for this segment (25-minute segments with 5-minute gaps)
+    start_time = datetime(2024, 1, 1, 9, 0, 0) + timedelta(minutes=(segment-1) * 30)
+    end_time = start_time + timedelta(minutes=25)
+    
+    # Format timestamps for filename
+    start_str = start_time.strftime('%Y%m%d%H%M%S')
+    end_str = end_time.strftime('%Y%m%d%H%M%S')
+    
+    # One random generator per segment, shared by all draws below
+    rng = np.random.default_rng(seed_sequence)
+    
+    # Generate acceleration data
+    acceleration_data = generate_synthetic_acceleration_data(
+        sensor_names=sensor_names,
+        duration_minutes=25,
+        fs=fs,
+        base_frequencies=[4 + segment*0.1, 12 + segment*0.05, 18 + segment*0.02, 25, 35],  # Slight frequency drift
+        noise_level=0.05 + 0.01 * rng.standard_normal(),  # Variable noise
+        trend_amplitude=0.02 + 0.005 * rng.standard_normal(),  # Variable trends
+        start_time=start_time,
+        rng=rng,
+        include_time_index=include_time_index
+    )
+    
+    # Create metadata
+    metadata = {
+        'tag_columns': [],
+        'sampling_frequency': fs,
+        'segment_number': segment,
+        'start_time': start_time.isoformat(),
+        'end_time': end_time.isoformat(),
+        'generation_timestamp': datetime.now().isoformat(),
+        'synthetic': True,
+        'data_quality': str(rng.choice(['good', 'fair', 'excellent'], p=[0.6, 0.3, 0.1]))
+    }
+    
+    # Create filename
+    filename = f"{case_name}_segment{segment}_{start_str}_{end_str}.{output_format}"
+    file_path = output_path / filename
+    
+    # Save file
+    if output_format == 'parquet':
+        create_sample_parquet_file(file_path, acceleration_data, metadata)
+    else:
+        create_sample_pickle_file(file_path, acceleration_data, metadata)
+    
+    return filename
+
+
+def generate_sample_dataset(config, output_dir, n_segments=10, case_name='sample', n_workers=None,
+                            seed=None, output_format='pickle', include_time_index=True):
     """
     Generate a complete sample dataset with multiple segments.
     
@@ -155,6 +499,12 @@ def generate_sample_dataset(config, output_dir, n_segments=10, case_name='sample
     - output_dir: output directory for sample files
     - n_segments: number of segments to generate
     - case_name: name prefix for files
+    - n_workers: number of worker processes (default: os.cpu_count())
+    - seed: base seed for reproducible datasets (default: fresh entropy)
+    - output_format: 'pickle' (workflow input format) or 'parquet' (Snappy-compressed,
+      metadata in a sibling .yaml file)
+    - include_time_index: store the DatetimeIndex in each file; if False the index is
+      rebuilt from the metadata with reconstruct_index()
     """
     # Get sensor names from config
     oma_config = config.get('oma', {})
@@ -174,51 +524,18 @@ def generate_sample_dataset(config, output_dir, n_segments=10, case_name='sample
     print(f"Sampling frequency: {fs} Hz")
     print(f"Output directory: {output_path}")
     
-    for segment in range(1, n_segments + 1):
-        # Generate time stamps for this segment (25-minute segments with 5-minute gaps)
-        base_time = datetime(2024, 1, 1, 9, 0, 0) + timedelta(minutes=(segment-1) * 30)
-        start_time = base_time
-        end_time = base_time + timedelta(minutes=25)
-        
-        # Format timestamps for filename
-        start_str = start_time.strftime('%Y%m%d%H%M%S')
-        end_str = end_time.strftime('%Y%m%d%H%M%S')
-        
-        # Generate acceleration data
-        acceleration_data = generate_synthetic_acceleration_data(
-            sensor_names=sensor_names,
-            duration_minutes=25,
-            fs=fs,
-            base_frequencies=[4 + segment*0.1, 12 + segment*0.05, 18 + segment*0.02, 25, 35],  # Slight frequency drift
-            noise_level=0.05 + 0.01 * np.random.randn(),  # Variable noise
-            trend_amplitude=0.02 + 0.005 * np.random.randn()  # Variable trends
-        )
-        
-        # Set the time index to match the segment times
-        new_index = pd.date_range(start=start_time, end=end_time, periods=len(acceleration_data))
-        acceleration_data.index = new_index
-        
-        # Create metadata
-        metadata = {
-            'tag_columns': [],
-            'sampling_frequency': fs,
-            'segment_number': segment,
-            'start_time': start_time.isoformat(),
-            'end_time': end_time.isoformat(),
-            'generation_timestamp': datetime.now().isoformat(),
-            'synthetic': True,
-            'data_quality': np.random.choice(['good', 'fair', 'excellent'], p=[0.6, 0.3, 0.1])
-        }
-        
-        # Create filename
-        filename = f"{case_name}_segment{segment}_{start_str}_{end_str}.pickle"
-        file_path = output_path / filename
-        
-        # Save file
-        create_sample_pickle_file(file_path, acceleration_data, metadata)
-        
-        if segment <= 5 or segment % 10 == 0:  # Print progress for first 5 and every 10th
-            print(f"Generated segment {segment}: {filename}")
+    # Segments are independent: generate them in parallel, each from its own seed
+    segments = range(1, n_segments + 1)
+    seed_sequences = np.random.SeedSequence(seed).spawn(n_segments)
+    worker = partial(_generate_one_segment, sensor_names=sensor_names, fs=fs,
+                     output_path=output_path, case_name=case_name,
+                     output_format=output_format, include_time_index=include_time_index)
+    
+    with ProcessPoolExecutor(max_workers=n_workers or os.cpu_count(),
+                             initializer=_init_worker) as executor:
+        for segment, filename in zip(segments, executor.map(worker, segments, seed_sequences)):
+            if segment <= 5 or segment % 10 == 0:  # Print progress for first 5 and every 10th
+                print(f"Generated segment {segment}: {filename}")
     
     print(f"\nGenerated {n_segments} sample files in {output_path}")
     
@@ -232,7 +549,7 @@ def generate_sample_dataset(config, output_dir, n_segments=10, case_name='sample
             'segment_duration_minutes': 25,
             'generation_date': datetime.now().isoformat()
         },
-        'file_pattern': f"{case_name}_segment{{N}}_{{start}}_{{end}}.pickle",
+        'file_pattern': f"{case_name}_segment{{N}}_{{start}}_{{end}}.{output_format}",
         'expected_workflow_steps': [
             f"step1_data_filtering_qc.py --config config.yaml",
             f"step2_data_processing_oma.py --config config.yaml --case-name {case_name}",
@@ -242,7 +559,7 @@ def generate_sample_dataset(config, output_dir, n_segments=10, case_name='sample
     
     summary_path = output_path / 'dataset_summary.yaml'
     with open(summary_path, 'w') as f:
-        yaml.dump(summary, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(summary, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
     
     print(f"Dataset summary saved to: {summary_path}")
     
@@ -256,6 +573,12 @@ def main():
     parser.add_argument('--output-dir', help='Output directory (default: from config)')
     parser.add_argument('--n-segments', type=int, default=10, help='Number of segments to generate')
     parser.add_argument('--case-name', default='sample', help='Case name prefix for files')
+    parser.add_argument('--n-workers', type=int, help='Number of worker processes (default: all CPUs)')
+    parser.add_argument('--seed', type=int, help='Random seed for a reproducible dataset')
+    parser.add_argument('--format', choices=['pickle', 'parquet'], default='pickle',
+                        help='Output file format (default: pickle, as expected by the workflow)')
+    parser.add_argument('--no-time-index', action='store_true',
+                        help='Omit the DatetimeIndex from files (rebuild with reconstruct_index)')
     
     args = parser.parse_args()
     
@@ -287,7 +610,11 @@ def main():
             config=config,
             output_dir=output_dir,
             n_segments=args.n_segments,
-            case_name=args.case_name
+            case_name=args.case_name,
+            n_workers=args.n_workers,
+            seed=args.seed,
+            output_format=args.format,
+            include_time_index=not args.no_time_index
         )
         
         print("\n" + "=" * 50)